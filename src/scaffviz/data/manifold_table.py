@@ -14,7 +14,7 @@ class ManifoldTable(MoleculeTable):
     @staticmethod
     def fromMolTable(mol_table : MoleculeTable, name=None):
         name = name if name is not None else mol_table.name
-        mt = ManifoldTable(name, mol_table.getDF(), smiles_col=mol_table.smilesCol, store_dir=mol_table.storeDir, index_cols=mol_table.indexCols)
+        mt = ManifoldTable(name, mol_table.getDF(), smiles_col=mol_table.smilesCol, store_dir=mol_table.storeDir, index_cols=mol_table.indexCols, n_jobs=mol_table.nJobs, chunk_size=mol_table.chunkSize)
         mt.descriptors = mol_table.descriptors
         return mt
 
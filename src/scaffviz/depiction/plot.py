@@ -101,9 +101,13 @@ class Plot:
             return fig
 
         # interactive plot:
-        excluded = df.columns[df.columns.str.contains('RDMol')].tolist() + list(table.getDescriptorNames()) + manifold_cols + df.columns[~df.columns.isin(card_data)].tolist()
+        # use a set, membership is tested for every column and descriptor sets can have thousands of columns
+        excluded = set(df.columns[df.columns.str.contains('RDMol')]) | set(table.getDescriptorNames()) | set(manifold_cols) | set(df.columns[~df.columns.isin(card_data)])
         included = [title_data] + [col for col in df.columns if col not in excluded]
         smiles_col = [table.smilesCol] + table.getScaffoldNames() if table.hasScaffolds else [table.smilesCol]
+        # only pass the columns the app needs, the running app keeps a reference to this frame
+        app_cols = smiles_col + [title_data, x, y] + included + ([color_by] if color_by else [])
+        df = df[list(dict.fromkeys(app_cols))]
         app_scatter = molplotly.add_molecules(fig=fig,
           df=df,
           smiles_col=smiles_col,
@@ -187,14 +191,14 @@ class ModelPerformancePlot(ModelPlot):
         df[col_err] = df[col_label] - df[col_pred]
         if model.task.isClassification():
             # convert True/False to string labels
-            df[col_label] = [f"Class_{int(x)}" for x in df[col_label]]
-            df[col_pred] = [f"Class_{int(x)}" for x in df[col_pred]]
+            df[col_label] = "Class_" + df[col_label].astype(int).astype(str)
+            df[col_pred] = "Class_" + df[col_pred].astype(int).astype(str)
         return df, col_label, col_pred, col_err, cols_probas
 
     def getCVData(self, model, target_prop):
         cv_path = self.cvPaths[model]
         df, col_label, col_pred, col_err, cols_probas = self.getPerfData(cv_path, model, target_prop)
-        df["TestSet"] = [f"Fold_{int(x) + 1}" for x in df["Fold"]]
+        df["TestSet"] = "Fold_" + (df["Fold"].astype(int) + 1).astype(str)
         del df["Fold"]
         return df, col_label, col_pred, col_err, cols_probas
 